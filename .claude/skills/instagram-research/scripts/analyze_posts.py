@@ -5,20 +5,111 @@ Outputs JSON with outliers and metadata for report generation.
 """
 
 import json
+import os
 import argparse
-import statistics
 from datetime import datetime
 from pathlib import Path
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import heapq
 import re
 
+# Conditional imports
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Inputs above this size are stream-parsed with ijson (when installed) so the
+# raw file bytes are never held in memory alongside the parsed items
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Below this many items, process-pool startup costs more than it saves
+PARALLEL_MIN_POSTS = 20000
+
+# Single-pass caption tokenizer: URL | @mention/#hashtag | 4+ letter word
+_TOKEN_RE = re.compile(r'(https?://\S+)|([@#])(\w+)|\b([a-zA-Z]{4,})\b')
+
+# Words (and platform boilerplate) excluded from keyword counts
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who',
+    'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only',
+    'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but',
+    'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by',
+    'for', 'with', 'about', 'against', 'between', 'into', 'through',
+    'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up',
+    'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further',
+    'then', 'once', 'here', 'there', 'your', 'my', 'his', 'her', 'its',
+    'our', 'their', 'get', 'got', 'like', 'dont', 'im', 'ive', 'youre',
+    'https', 'http', 'amp', 'link', 'bio', 'comment', 'follow', 'check'
+})
+
 
 def load_posts(input_path: str) -> list[dict]:
     """Load posts from JSON file."""
+    if IJSON_AVAILABLE and os.path.getsize(input_path) > STREAM_THRESHOLD_BYTES:
+        with open(input_path, 'rb') as f:
+            return list(ijson.items(f, 'item', use_float=True))
+    if ORJSON_AVAILABLE:
+        with open(input_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(input_path, 'r') as f:
         return json.load(f)
 
 
+def _dumps_indented(value, depth: int) -> bytes:
+    """orjson-encode value with 2-space indent, nested depth levels deep."""
+    encoded = orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2)
+    return encoded.replace(b'\n', b'\n' + b'  ' * depth)
+
+
+def save_json(data, output_path: str):
+    """
+    Write data as indented JSON, creating parent directories.
+    Top-level lists are encoded one record at a time rather than as one buffer.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            if not isinstance(data, dict) or not data:
+                f.write(_dumps_indented(data, 0))
+                return
+            f.write(b'{')
+            for i, (key, value) in enumerate(data.items()):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(orjson.dumps(str(key)) + b': ')
+                if isinstance(value, list) and value:
+                    f.write(b'[')
+                    for j, record in enumerate(value):
+                        f.write(b',\n    ' if j else b'\n    ')
+                        f.write(_dumps_indented(record, 2))
+                    f.write(b'\n  ]')
+                else:
+                    f.write(_dumps_indented(value, 1))
+            f.write(b'\n}')
+        return
+    # json.dump already encodes incrementally via iterencode
+    with open(output_path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+
+
 def calculate_engagement_score(post: dict) -> float:
     """
     Calculate weighted engagement score.
@@ -26,94 +117,197 @@ def calculate_engagement_score(post: dict) -> float:
     - Likes (1x): Passive approval
     - Video views (0.1x): Weighted lower due to auto-play
     """
-    likes = post.get('likesCount', 0) or 0
-    comments = post.get('commentsCount', 0) or 0
-    video_views = post.get('videoViewCount', 0) or post.get('videoPlayCount', 0) or 0
+    get = post.get
+    likes = get('likesCount', 0) or 0
+    comments = get('commentsCount', 0) or 0
+    video_views = get('videoViewCount', 0) or get('videoPlayCount', 0) or 0
     return likes + (3 * comments) + (0.1 * video_views)
 
 
-def calculate_engagement_rate(post: dict) -> float:
-    """Calculate engagement rate relative to follower count."""
+def calculate_engagement_rate(post: dict, engagement: float = None) -> float:
+    """
+    Calculate engagement rate relative to follower count.
+    Pass an already computed engagement score to avoid recalculating it.
+    """
     followers = post.get('ownerFollowersCount', 0) or 0
-    engagement = calculate_engagement_score(post)
+    if engagement is None:
+        engagement = calculate_engagement_score(post)
     if followers == 0:
         return engagement
     return (engagement / followers) * 100
 
 
-def identify_outliers(posts: list[dict], threshold_multiplier: float = 2.0) -> list[dict]:
+def _engagement_arrays(posts: list[dict]) -> tuple:
+    """
+    Vectorized calculate_engagement_score/calculate_engagement_rate.
+    Returns (scores, rates) as float64 arrays aligned with posts.
+    """
+    n = len(posts)
+    likes = np.fromiter((p.get('likesCount', 0) or 0 for p in posts), dtype=np.float64, count=n)
+    comments = np.fromiter((p.get('commentsCount', 0) or 0 for p in posts), dtype=np.float64, count=n)
+    views = np.fromiter((p.get('videoViewCount', 0) or p.get('videoPlayCount', 0) or 0 for p in posts), dtype=np.float64, count=n)
+    followers = np.fromiter((p.get('ownerFollowersCount', 0) or 0 for p in posts), dtype=np.float64, count=n)
+
+    # Fused in-place accumulation (same operation order as
+    # calculate_engagement_score) so no temporary arrays are allocated
+    scores = likes
+    scores += np.multiply(comments, 3, out=comments)
+    scores += np.multiply(views, 0.1, out=views)
+    rates = scores.copy()
+    # Same guard as calculate_engagement_rate: only exactly 0 skips the division
+    has_followers = followers != 0
+    np.divide(scores, followers, out=rates, where=has_followers)
+    np.multiply(rates, 100, out=rates, where=has_followers)
+    return scores, rates
+
+
+def _mean_stdev(values: list[float]) -> tuple[float, float]:
+    """Mean and sample standard deviation in one pass (Welford's algorithm)."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    std_dev = (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+    return mean, std_dev
+
+
+def identify_outliers(
+    posts: list[dict],
+    threshold_multiplier: float = 2.0,
+    max_outliers: int = None
+) -> list[dict]:
     """
     Identify outlier posts with engagement rate > mean + (threshold × std_dev).
+    If max_outliers is set, only the top N by engagement score are returned.
     """
+    if max_outliers is not None and max_outliers < 1:
+        raise ValueError(f'max_outliers must be at least 1, got {max_outliers}')
     if not posts:
         return []
 
-    for post in posts:
-        post['_engagement_score'] = calculate_engagement_score(post)
-        post['_engagement_rate'] = calculate_engagement_rate(post)
+    if NUMPY_AVAILABLE:
+        scores, rates = _engagement_arrays(posts)
+        if len(posts) < 2:
+            indices = range(len(posts))
+        else:
+            threshold = rates.mean() + (threshold_multiplier * rates.std(ddof=1))
+            indices = np.flatnonzero(rates > threshold).tolist()
+        scores = scores.tolist()
+        rates = rates.tolist()
+    else:
+        scores = [calculate_engagement_score(post) for post in posts]
+        rates = [calculate_engagement_rate(post, score) for post, score in zip(posts, scores)]
+        if len(rates) < 2:
+            indices = range(len(posts))
+        else:
+            mean_rate, std_dev = _mean_stdev(rates)
+            threshold = mean_rate + (threshold_multiplier * std_dev)
+            indices = [i for i, rate in enumerate(rates) if rate > threshold]
 
-    rates = [p['_engagement_rate'] for p in posts]
-    if len(rates) < 2:
-        return posts
+    # Only the returned posts are annotated
+    outliers = []
+    for i in indices:
+        post = posts[i]
+        post['_engagement_score'] = scores[i]
+        post['_engagement_rate'] = rates[i]
+        outliers.append(post)
+    if len(posts) < 2:
+        return outliers[:max_outliers]
 
-    mean_rate = statistics.mean(rates)
-    std_dev = statistics.stdev(rates) if len(rates) > 1 else 0
-    threshold = mean_rate + (threshold_multiplier * std_dev)
-
-    outliers = [p for p in posts if p['_engagement_rate'] > threshold]
+    if max_outliers is not None:
+        return heapq.nlargest(max_outliers, outliers, key=lambda x: x['_engagement_score'])
     outliers.sort(key=lambda x: x['_engagement_score'], reverse=True)
     return outliers
 
 
-def extract_topics(posts: list[dict]) -> dict:
-    """Extract trending hashtags, mentions, and keywords."""
-    hashtags = Counter()
-    keywords = Counter()
-
-    stop_words = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-        'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who',
-        'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few',
-        'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only',
-        'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but',
-        'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by',
-        'for', 'with', 'about', 'against', 'between', 'into', 'through',
-        'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up',
-        'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further',
-        'then', 'once', 'here', 'there', 'your', 'my', 'his', 'her', 'its',
-        'our', 'their', 'get', 'got', 'like', 'dont', 'im', 'ive', 'youre',
-        'https', 'http', 'amp', 'link', 'bio', 'comment', 'follow', 'check'
-    }
+def _count_topics(items) -> tuple[dict, dict, set]:
+    """Count topics and collect owners over (owner, caption, hashtags) tuples."""
+    hashtags = defaultdict(int)
+    keywords = defaultdict(int)
+    accounts = set()
 
-    for post in posts:
-        caption = post.get('caption', '') or ''
+    for owner, caption, post_hashtags in items:
+        if owner:
+            accounts.add(owner)
 
         # Hashtags
-        post_hashtags = post.get('hashtags', []) or []
         if isinstance(post_hashtags, list):
-            hashtags.update([h.lower().lstrip('#') for h in post_hashtags])
-        hashtags.update(re.findall(r'#(\w+)', caption.lower()))
+            for h in post_hashtags:
+                hashtags[h.lower().lstrip('#')] += 1
+
+        # Caption hashtags and keywords (URLs and mentions are skipped)
+        for m in _TOKEN_RE.finditer(caption):
+            if m.group(2) == '#':
+                hashtags[m.group(3).lower()] += 1
+            elif m.group(4):
+                word = m.group(4).lower()
+                if word not in _STOP_WORDS:
+                    keywords[word] += 1
+
+    return hashtags, keywords, accounts
 
-        # Keywords
-        text_clean = re.sub(r'https?://\S+', '', caption)
-        text_clean = re.sub(r'[@#]\w+', '', text_clean)
-        text_words = re.findall(r'\b[a-zA-Z]{4,}\b', text_clean.lower())
-        keywords.update([w for w in text_words if w not in stop_words])
+
+def extract_topics(posts: list[dict], workers: int = 1) -> dict:
+    """
+    Extract trending hashtags, mentions, and keywords, plus the set of post owners.
+    Large inputs are split across worker processes when workers > 1.
+    """
+    # Only the fields topic extraction reads are passed on (and pickled)
+    items = (
+        (post.get('ownerUsername'), post.get('caption', '') or '', post.get('hashtags', []) or [])
+        for post in posts
+    )
+
+    if workers > 1 and len(posts) >= PARALLEL_MIN_POSTS:
+        items = list(items)
+        chunk_size = -(-len(items) // workers)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_count_topics, chunks))
+    else:
+        results = [_count_topics(items)]
+
+    # Merge per-chunk counts (in input order, so ties rank as in a serial run)
+    hashtags = Counter()
+    keywords = Counter()
+    accounts = set()
+    for chunk_hashtags, chunk_keywords, chunk_accounts in results:
+        hashtags.update(chunk_hashtags)
+        keywords.update(chunk_keywords)
+        accounts |= chunk_accounts
 
     return {
         'hashtags': hashtags.most_common(20),
-        'keywords': keywords.most_common(30)
+        'keywords': keywords.most_common(30),
+        'accounts': list(accounts)
     }
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid int value: {value!r}')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description='Identify Instagram outliers')
     parser.add_argument('--input', '-i', required=True, help='Input JSON file')
     parser.add_argument('--output', '-o', required=True, help='Output JSON file')
     parser.add_argument('--threshold', '-t', type=float, default=2.0,
                         help='Outlier threshold multiplier (default: 2.0)')
+    parser.add_argument('--max-outliers', '-m', type=_positive_int,
+                        help='Keep only the top N outliers by engagement score (default: all)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Worker processes for topic extraction on large inputs (default: 1)')
 
     args = parser.parse_args()
 
@@ -122,11 +316,12 @@ def main():
     print(f"Loaded {len(posts)} posts/reels")
 
     print(f"Identifying outliers (threshold: {args.threshold}x std dev)...")
-    outliers = identify_outliers(posts, args.threshold)
+    outliers = identify_outliers(posts, args.threshold, args.max_outliers)
     print(f"Found {len(outliers)} outlier posts")
 
     print("Extracting topics...")
-    topics = extract_topics(posts)
+    topics = extract_topics(posts, args.workers)
+    accounts = topics.pop('accounts')
 
     # Build output with metadata
     output = {
@@ -135,13 +330,11 @@ def main():
         'outlier_count': len(outliers),
         'threshold': args.threshold,
         'topics': topics,
-        'accounts': list(set(p.get('ownerUsername', '') for p in posts if p.get('ownerUsername'))),
+        'accounts': accounts,
         'outliers': outliers
     }
 
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, 'w') as f:
-        json.dump(output, f, indent=2, default=str)
+    save_json(output, args.output)
 
     print(f"Outliers saved to: {args.output}")
     print(f"- {len(outliers)} outliers identified")
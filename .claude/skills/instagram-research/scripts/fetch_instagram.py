@@ -7,6 +7,7 @@ Requires APIFY_TOKEN environment variable (or in .env file).
 import os
 import sys
 import json
+import re
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -24,26 +25,42 @@ except ImportError:
     print("Error: apify-client not installed. Run: pip install apify-client")
     sys.exit(1)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Table rows whose first cell is an @username
+_ACCOUNT_RE = re.compile(r'^\s*\|\s*@([A-Za-z0-9_.]+)\s*\|', re.MULTILINE)
+
 
 def parse_accounts_file(accounts_path: str) -> list[str]:
-    """Parse instagram-accounts.md and extract usernames."""
-    usernames = []
-    with open(accounts_path, 'r') as f:
-        in_table = False
-        for line in f:
-            line = line.strip()
-            if line.startswith('| Username') or line.startswith('| Handle'):
-                in_table = True
-                continue
-            if line.startswith('|---'):
-                continue
-            if in_table and line.startswith('|'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 2:
-                    username = parts[1]
-                    if username.startswith('@') and not username.startswith('@example'):
-                        usernames.append(username.lstrip('@'))
-    return usernames
+    """Parse instagram-accounts.md and extract usernames from the accounts table."""
+    text = Path(accounts_path).read_text()
+    return [
+        m.group(1) for m in _ACCOUNT_RE.finditer(text)
+        if not m.group(1).startswith('example')
+    ]
+
+
+def save_json(data, output_path: str):
+    """Write data as indented JSON, creating parent directories."""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def fetch_dataset_items(client: 'ApifyClient', dataset_id: str) -> list[dict]:
+    """Download every item of an Apify dataset in a single request."""
+    raw = client.dataset(dataset_id).get_items_as_bytes(item_format='json')
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def fetch_profiles(client: 'ApifyClient', usernames: list[str]) -> dict[str, dict]:
@@ -66,7 +83,7 @@ def fetch_profiles(client: 'ApifyClient', usernames: list[str]) -> dict[str, dic
     run = client.actor("apify/instagram-profile-scraper").call(run_input=run_input)
 
     profiles = {}
-    for item in client.dataset(run["defaultDatasetId"]).iterate_items():
+    for item in fetch_dataset_items(client, run["defaultDatasetId"]):
         username = item.get('username', '').lower()
         if username:
             profiles[username] = {
@@ -135,8 +152,8 @@ def fetch_instagram(
     run = client.actor("apify/instagram-scraper").call(run_input=run_input)
 
     # Fetch results and merge profile data
-    items = []
-    for item in client.dataset(run["defaultDatasetId"]).iterate_items():
+    items = fetch_dataset_items(client, run["defaultDatasetId"])
+    for item in items:
         # Merge follower count from profile data
         owner_username = (item.get('ownerUsername', '') or '').lower()
         if owner_username and owner_username in profiles:
@@ -145,14 +162,11 @@ def fetch_instagram(
             item['ownerFollowingCount'] = profile['followingCount']
             if not item.get('ownerFullName'):
                 item['ownerFullName'] = profile['fullName']
-        items.append(item)
 
     print(f"Fetched {len(items)} {results_type} total")
 
     if output_path:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(items, f, indent=2, default=str)
+        save_json(items, output_path)
         print(f"Saved raw data to: {output_path}")
 
     return items
@@ -7,6 +7,7 @@ Requires APIFY_TOKEN environment variable (or in .env file).
 import os
 import sys
 import json
+import re
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -24,26 +25,86 @@ except ImportError:
     print("Error: apify-client not installed. Run: pip install apify-client")
     sys.exit(1)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared default for missing nested metadata; only ever read via .get()
+_EMPTY = {}
+
+# Table rows whose first cell is an @username
+_ACCOUNT_RE = re.compile(r'^\s*\|\s*@([A-Za-z0-9_.]+)\s*\|', re.MULTILINE)
+
 
 def parse_accounts_file(accounts_path: str) -> list[str]:
-    """Parse tiktok-accounts.md and extract usernames."""
-    usernames = []
-    with open(accounts_path, 'r') as f:
-        in_table = False
-        for line in f:
-            line = line.strip()
-            if line.startswith('| Username') or line.startswith('| Handle'):
-                in_table = True
-                continue
-            if line.startswith('|---'):
-                continue
-            if in_table and line.startswith('|'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 2:
-                    username = parts[1]
-                    if username.startswith('@') and not username.startswith('@example'):
-                        usernames.append(username.lstrip('@'))
-    return usernames
+    """Parse tiktok-accounts.md and extract usernames from the accounts table."""
+    text = Path(accounts_path).read_text()
+    return [
+        m.group(1) for m in _ACCOUNT_RE.finditer(text)
+        if not m.group(1).startswith('example')
+    ]
+
+
+def save_json(data, output_path: str):
+    """Write data as indented JSON, creating parent directories."""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def fetch_dataset_items(client: 'ApifyClient', dataset_id: str) -> list[dict]:
+    """Download every item of an Apify dataset in a single request."""
+    raw = client.dataset(dataset_id).get_items_as_bytes(item_format='json')
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def normalize_item(item: dict) -> dict:
+    """Normalize field names for consistency with analysis script."""
+    author = item.get('authorMeta') or _EMPTY
+    video = item.get('videoMeta') or _EMPTY
+    music = item.get('musicMeta') or _EMPTY
+    return {
+        'id': item.get('id'),
+        'text': item.get('text', ''),
+        'createTime': item.get('createTime'),
+        'createTimeISO': item.get('createTimeISO'),
+        'webVideoUrl': item.get('webVideoUrl'),
+        # Engagement metrics
+        'diggCount': item.get('diggCount', 0),  # likes/hearts
+        'shareCount': item.get('shareCount', 0),
+        'playCount': item.get('playCount', 0),
+        'commentCount': item.get('commentCount', 0),
+        'collectCount': item.get('collectCount', 0),  # saves/bookmarks
+        # Author metadata
+        'authorUsername': author.get('name', ''),
+        'authorNickname': author.get('nickName', ''),
+        'authorFollowers': author.get('fans', 0),
+        'authorFollowing': author.get('following', 0),
+        'authorHearts': author.get('heart', 0),
+        'authorVerified': author.get('verified', False),
+        # Video metadata
+        'videoDuration': video.get('duration', 0),
+        'videoHeight': video.get('height'),
+        'videoWidth': video.get('width'),
+        'coverUrl': video.get('coverUrl'),
+        # Content metadata
+        'hashtags': item.get('hashtags', []),
+        'mentions': item.get('mentions', []),
+        'isPinned': item.get('isPinned', False),
+        'isAd': item.get('isAd', False),
+        # Music metadata
+        'musicName': music.get('musicName'),
+        'musicAuthor': music.get('musicAuthor'),
+        'musicOriginal': music.get('musicOriginal', False),
+    }
 
 
 def fetch_tiktok(
@@ -51,7 +112,8 @@ def fetch_tiktok(
     results_limit: int = 50,
     days_back: int = 30,
     sorting: str = "latest",
-    output_path: str = None
+    output_path: str = None,
+    include_raw: bool = False
 ) -> list[dict]:
     """
     Fetch TikTok videos from specified usernames using Apify TikTok Scraper.
@@ -62,6 +124,7 @@ def fetch_tiktok(
         days_back: Filter to only include posts newer than this many days
         sorting: Sort order - "latest", "popular", or "oldest"
         output_path: Optional path to save raw JSON output
+        include_raw: Also save the unnormalized items to a .raw.json sidecar
 
     Returns:
         List of video objects
@@ -97,54 +160,18 @@ def fetch_tiktok(
     run = client.actor("GdWCkxBtKWOsKjdch").call(run_input=run_input)
 
     # Fetch results
-    items = []
-    for item in client.dataset(run["defaultDatasetId"]).iterate_items():
-        # Normalize field names for consistency with analysis script
-        normalized = {
-            'id': item.get('id'),
-            'text': item.get('text', ''),
-            'createTime': item.get('createTime'),
-            'createTimeISO': item.get('createTimeISO'),
-            'webVideoUrl': item.get('webVideoUrl'),
-            # Engagement metrics
-            'diggCount': item.get('diggCount', 0),  # likes/hearts
-            'shareCount': item.get('shareCount', 0),
-            'playCount': item.get('playCount', 0),
-            'commentCount': item.get('commentCount', 0),
-            'collectCount': item.get('collectCount', 0),  # saves/bookmarks
-            # Author metadata
-            'authorUsername': item.get('authorMeta', {}).get('name', ''),
-            'authorNickname': item.get('authorMeta', {}).get('nickName', ''),
-            'authorFollowers': item.get('authorMeta', {}).get('fans', 0),
-            'authorFollowing': item.get('authorMeta', {}).get('following', 0),
-            'authorHearts': item.get('authorMeta', {}).get('heart', 0),
-            'authorVerified': item.get('authorMeta', {}).get('verified', False),
-            # Video metadata
-            'videoDuration': item.get('videoMeta', {}).get('duration', 0),
-            'videoHeight': item.get('videoMeta', {}).get('height'),
-            'videoWidth': item.get('videoMeta', {}).get('width'),
-            'coverUrl': item.get('videoMeta', {}).get('coverUrl'),
-            # Content metadata
-            'hashtags': item.get('hashtags', []),
-            'mentions': item.get('mentions', []),
-            'isPinned': item.get('isPinned', False),
-            'isAd': item.get('isAd', False),
-            # Music metadata
-            'musicName': item.get('musicMeta', {}).get('musicName'),
-            'musicAuthor': item.get('musicMeta', {}).get('musicAuthor'),
-            'musicOriginal': item.get('musicMeta', {}).get('musicOriginal', False),
-            # Raw item for reference
-            '_raw': item
-        }
-        items.append(normalized)
+    raw_items = fetch_dataset_items(client, run["defaultDatasetId"])
+    items = [normalize_item(item) for item in raw_items]
 
     print(f"Fetched {len(items)} videos total")
 
     if output_path:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(items, f, indent=2, default=str)
+        save_json(items, output_path)
         print(f"Saved raw data to: {output_path}")
+        if include_raw:
+            raw_path = output_path + '.raw.json'
+            save_json(raw_items, raw_path)
+            print(f"Saved unnormalized items to: {raw_path}")
 
     return items
 
@@ -165,6 +192,8 @@ def main():
                         help='Sort order (default: latest)')
     parser.add_argument('--output', '-o',
                         help='Output path for raw JSON')
+    parser.add_argument('--include-raw', action='store_true',
+                        help='Also save unnormalized Apify items to <output>.raw.json')
 
     args = parser.parse_args()
 
@@ -187,7 +216,8 @@ def main():
         results_limit=args.limit,
         days_back=args.days,
         sorting=args.sorting,
-        output_path=args.output
+        output_path=args.output,
+        include_raw=args.include_raw
     )
 
     # Output summary
@@ -0,0 +1,21 @@
+"""Tests for analyze_posts.py topic extraction."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from analyze_posts import extract_topics
+
+
+def test_extract_topics_skips_hashtags_without_a_name():
+    videos = [{
+        'authorUsername': 'creator',
+        'text': 'Morning routine #productivity',
+        'hashtags': [{'name': None}, {'name': None, 'title': None}, {'title': 'Habits'}, {'name': 'Focus'}],
+    }]
+
+    topics = extract_topics(videos)
+
+    assert dict(topics['hashtags']) == {'productivity': 1, 'habits': 1, 'focus': 1}
+    assert topics['accounts'] == ['creator']
@@ -11,15 +11,31 @@ import os
 import io
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Conditional imports
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 try:
     from google import genai
     from google.genai import types
@@ -36,6 +52,29 @@ except ImportError:
 
 GEMINI_MODEL = "gemini-2.5-flash"
 
+# Inputs above this size are stream-parsed with ijson (when installed)
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Concurrent video analyses, and how many of them may upload to the File API at once
+MAX_WORKERS = 4
+MAX_CONCURRENT_UPLOADS = 2
+
+_print_lock = threading.Lock()
+_upload_slots = threading.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+# Whether Gemini can read a platform's video URL directly. Instagram and TikTok
+# CDN links are signed/expiring or hotlink-protected, so those go straight to upload.
+DIRECT_URL_OK = {
+    "instagram": False,
+    "tiktok": False,
+    "youtube": True,
+}
+
+# Pooled session shared by the worker threads so CDN connections are reused
+if REQUESTS_AVAILABLE:
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
 # Platform-specific field mappings
 PLATFORM_MAPPINGS = {
     "instagram": {
@@ -64,7 +103,7 @@ PLATFORM_MAPPINGS = {
         "likes": ["diggCount", "likes", "likesCount"],
         "comments": ["commentCount", "comments", "commentsCount"],
         "views": ["playCount", "plays", "viewCount", "views"],
-        "is_video": lambda p: bool(get_field(p, ["videoUrl", "video_url", "webVideoUrl"])),
+        "is_video": lambda p: bool(_get_field_compiled(p, PLATFORM_MAPPINGS["tiktok"]["video_url"])),
     },
     "youtube": {
         "video_url": ["videoUrl", "url"],
@@ -79,6 +118,27 @@ PLATFORM_MAPPINGS = {
     },
 }
 
+
+def _default_is_video(mapping: dict):
+    """Build the fallback video check for a mapping without an is_video entry."""
+    return lambda p: bool(_get_field_compiled(p, mapping["video_url"]))
+
+
+def _compile_field_paths(mappings: dict):
+    """
+    Pre-split field names into key paths ("authorMeta.name" -> ("authorMeta", "name"))
+    so _get_field_compiled doesn't re-parse them for every post.
+    """
+    for mapping in mappings.values():
+        for field, names in mapping.items():
+            if isinstance(names, list):
+                mapping[field] = tuple(tuple(name.split('.')) for name in names)
+        if "is_video" not in mapping:
+            mapping["is_video"] = _default_is_video(mapping)
+
+
+_compile_field_paths(PLATFORM_MAPPINGS)
+
 VIDEO_ANALYSIS_PROMPT = '''Analyze this short-form video focusing on CONTENT STRUCTURE and HOOK TECHNIQUE.
 
 CAPTION/TITLE CONTEXT:
@@ -123,39 +183,107 @@ Focus on ACTIONABLE insights that could be replicated. Be specific about techniq
 Return ONLY valid JSON, no other text.'''
 
 
+def _load_mode(input_path: str, platform: str = None, max_videos: int = None) -> str:
+    """
+    How load_outliers reads input_path:
+    "select" streams it and stops after max_videos video posts,
+    "stream" streams every post, and "full" parses the whole file at once.
+    """
+    if not IJSON_AVAILABLE or os.path.getsize(input_path) <= STREAM_THRESHOLD_BYTES:
+        return "full"
+    return "select" if platform and max_videos else "stream"
+
+
+def load_outliers(input_path: str, platform: str = None, max_videos: int = None) -> list[dict]:
+    """
+    Load outlier posts from a JSON list or a dict with an 'outliers' key.
+    When a large file is streamed and platform/max_videos are given, parsing
+    stops as soon as max_videos video posts have been read.
+    """
+    mode = _load_mode(input_path, platform, max_videos)
+    if mode != "full":
+        with open(input_path, 'rb') as f:
+            # Peek at the top-level container to pick the item prefix
+            head = f.read(4096).lstrip()
+            f.seek(0)
+            prefix = 'outliers.item' if head.startswith(b'{') else 'item'
+            items = ijson.items(f, prefix, use_float=True)
+            if mode == "select":
+                is_video = _get_platform_mapping(platform)["is_video"]
+                return list(islice((p for p in items if is_video(p)), max_videos))
+            return list(items)
+
+    if ORJSON_AVAILABLE:
+        with open(input_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(input_path, 'r') as f:
+            data = json.load(f)
+
+    # Handle both list format and dict with 'outliers' key
+    if isinstance(data, dict) and 'outliers' in data:
+        return data['outliers']
+    return data
+
+
+def save_json(data, output_path: str):
+    """Write data as indented JSON, creating parent directories."""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
 def get_field(post: dict, field_names: list, default=None):
-    """Get field value trying multiple possible field names."""
-    for name in field_names:
-        # Handle nested fields like "authorMeta.name"
-        if '.' in name:
-            parts = name.split('.')
+    """
+    Get field value trying multiple possible field names.
+    Names may be dotted strings ("authorMeta.name") or pre-split key paths
+    as stored in PLATFORM_MAPPINGS.
+    """
+    field_paths = [tuple(name.split('.')) if isinstance(name, str) else name for name in field_names]
+    return _get_field_compiled(post, field_paths, default)
+
+
+def _get_field_compiled(post: dict, field_paths: tuple, default=None):
+    """get_field for key paths already split by _compile_field_paths."""
+    for path in field_paths:
+        if len(path) == 1:
+            value = post.get(path[0])
+        else:
+            # Nested fields like ("authorMeta", "name")
             value = post
-            for part in parts:
+            for part in path:
                 if isinstance(value, dict):
                     value = value.get(part)
                 else:
                     value = None
                     break
-            if value is not None:
-                return value
-        elif name in post and post[name] is not None:
-            return post[name]
+        if value is not None:
+            return value
     return default
 
 
+def _get_platform_mapping(platform: str) -> dict:
+    """Get the field mapping for a platform, defaulting to Instagram."""
+    return PLATFORM_MAPPINGS.get(platform, PLATFORM_MAPPINGS["instagram"])
+
+
 def extract_post_data(post: dict, platform: str) -> dict:
     """Extract normalized data from a post using platform mapping."""
-    mapping = PLATFORM_MAPPINGS.get(platform, PLATFORM_MAPPINGS["instagram"])
+    mapping = _get_platform_mapping(platform)
 
     return {
-        "video_url": get_field(post, mapping["video_url"]),
-        "post_id": get_field(post, mapping["post_id"], "unknown"),
-        "caption": get_field(post, mapping["caption"], ""),
-        "username": get_field(post, mapping["username"], "unknown"),
-        "url": get_field(post, mapping["url"], ""),
-        "likes": get_field(post, mapping["likes"], 0) or 0,
-        "comments": get_field(post, mapping["comments"], 0) or 0,
-        "views": get_field(post, mapping["views"], 0) or 0,
+        "video_url": _get_field_compiled(post, mapping["video_url"]),
+        "post_id": _get_field_compiled(post, mapping["post_id"], "unknown"),
+        "caption": _get_field_compiled(post, mapping["caption"], ""),
+        "username": _get_field_compiled(post, mapping["username"], "unknown"),
+        "url": _get_field_compiled(post, mapping["url"], ""),
+        "likes": _get_field_compiled(post, mapping["likes"], 0) or 0,
+        "comments": _get_field_compiled(post, mapping["comments"], 0) or 0,
+        "views": _get_field_compiled(post, mapping["views"], 0) or 0,
         "engagement_score": post.get('_engagement_score', 0),
         "engagement_rate": post.get('_engagement_rate', 0),
     }
@@ -163,9 +291,7 @@ def extract_post_data(post: dict, platform: str) -> dict:
 
 def is_video_post(post: dict, platform: str) -> bool:
     """Check if post is a video using platform-specific logic."""
-    mapping = PLATFORM_MAPPINGS.get(platform, PLATFORM_MAPPINGS["instagram"])
-    is_video_fn = mapping.get("is_video", lambda p: bool(get_field(p, mapping["video_url"])))
-    return is_video_fn(post)
+    return _get_platform_mapping(platform)["is_video"](post)
 
 
 def parse_response(text: str) -> dict:
@@ -181,7 +307,7 @@ def parse_response(text: str) -> dict:
 
 def download_video(video_url: str, timeout: int = 60) -> bytes:
     """Download video from URL."""
-    response = requests.get(video_url, timeout=timeout)
+    response = _SESSION.get(video_url, timeout=timeout)
     response.raise_for_status()
     return response.content
 
@@ -199,16 +325,22 @@ def upload_video_to_gemini(client, video_bytes: bytes, display_name: str):
     return file
 
 
-def wait_for_processing(client, file, timeout: int = 300):
-    """Wait for Gemini to process uploaded file."""
+def wait_for_processing(client, file, timeout: int = 300, poll_interval: float = 0.5,
+                        max_poll_interval: float = 5.0):
+    """
+    Wait for Gemini to process uploaded file.
+    Polls start at poll_interval and back off by 1.5x up to max_poll_interval.
+    """
     start = time.time()
+    delay = poll_interval
     while time.time() - start < timeout:
         file = client.files.get(name=file.name)
         if file.state.name == "ACTIVE":
             return file
         elif file.state.name == "FAILED":
             raise RuntimeError(f"File processing failed: {file.name}")
-        time.sleep(5)
+        time.sleep(delay)
+        delay = min(delay * 1.5, max_poll_interval)
     raise TimeoutError(f"File processing timeout: {file.name}")
 
 
@@ -232,6 +364,76 @@ def analyze_video(client, video_source, caption: str) -> dict:
     return {"error": "No response from Gemini"}
 
 
+def _log(message: str):
+    """Print progress from worker threads without interleaving lines."""
+    with _print_lock:
+        print(message)
+
+
+def _process_one(client, post: dict, i: int, total: int, platform: str) -> dict:
+    """Analyze a single video post. Returns None if it has no video URL."""
+    data = extract_post_data(post, platform)
+    video_url = data["video_url"]
+
+    if not video_url:
+        _log(f"  [{i}/{total}] Skipping - no video URL")
+        return None
+
+    _log(f"  [{i}/{total}] Analyzing @{data['username']} - {data['post_id']}...")
+
+    result = {
+        "post_id": data["post_id"],
+        "username": data["username"],
+        "url": data["url"],
+        "platform": platform,
+        "engagement_score": data["engagement_score"],
+        "engagement_rate": data["engagement_rate"],
+        "likes": data["likes"],
+        "comments": data["comments"],
+        "views": data["views"],
+    }
+
+    try:
+        # Try direct URL first, on platforms where Gemini can fetch it
+        if DIRECT_URL_OK.get(platform, False):
+            try:
+                analysis = analyze_video(client, video_url, data["caption"])
+                if 'error' not in analysis and 'raw_analysis' not in analysis:
+                    result['analysis'] = analysis
+                    hook = analysis.get('hook', {}).get('technique', 'analyzed')
+                    _log(f"    [{i}/{total}] Done: {hook}")
+                    return result
+            except Exception:
+                _log(f"    [{i}/{total}] Direct URL failed, trying upload...")
+
+        # Fallback: download and upload
+        video_bytes = download_video(video_url)
+        _log(f"    [{i}/{total}] Downloaded {len(video_bytes) / 1024 / 1024:.1f} MB")
+
+        with _upload_slots:
+            file = upload_video_to_gemini(client, video_bytes, f"{platform}_{data['post_id']}")
+        _log(f"    [{i}/{total}] Uploaded, processing...")
+
+        file = wait_for_processing(client, file)
+        analysis = analyze_video(client, file, data["caption"])
+        result['analysis'] = analysis
+
+        hook = analysis.get('hook', {}).get('technique', 'analyzed')
+        _log(f"    [{i}/{total}] Done: {hook}")
+
+        # Cleanup
+        try:
+            client.files.delete(name=file.name)
+        except:
+            pass
+
+    except Exception as e:
+        _log(f"    [{i}/{total}] Error: {e}")
+        result['error'] = str(e)
+
+    return result
+
+
 def analyze_videos(outliers: list[dict], platform: str = "instagram", max_videos: int = 5) -> list[dict]:
     """
     Analyze top outlier videos with Gemini AI.
@@ -260,79 +462,25 @@ def analyze_videos(outliers: list[dict], platform: str = "instagram", max_videos
 
     client = genai.Client(api_key=api_key)
 
-    # Filter to videos only using platform-specific logic
-    video_posts = [p for p in outliers if is_video_post(p, platform)][:max_videos]
+    # Filter to videos only using platform-specific logic, stopping once enough are found
+    is_video = _get_platform_mapping(platform)["is_video"]
+    video_posts = list(islice((p for p in outliers if is_video(p)), max_videos))
 
     if not video_posts:
         print("No video content found in outliers")
         return []
 
     print(f"Analyzing {len(video_posts)} {platform} videos with Gemini AI...")
-    results = []
-
-    for i, post in enumerate(video_posts, 1):
-        data = extract_post_data(post, platform)
-        video_url = data["video_url"]
-
-        if not video_url:
-            print(f"  [{i}/{len(video_posts)}] Skipping - no video URL")
-            continue
-
-        print(f"  [{i}/{len(video_posts)}] Analyzing @{data['username']} - {data['post_id']}...")
-
-        result = {
-            "post_id": data["post_id"],
-            "username": data["username"],
-            "url": data["url"],
-            "platform": platform,
-            "engagement_score": data["engagement_score"],
-            "engagement_rate": data["engagement_rate"],
-            "likes": data["likes"],
-            "comments": data["comments"],
-            "views": data["views"],
-        }
+    total = len(video_posts)
 
-        try:
-            # Try direct URL first
-            try:
-                analysis = analyze_video(client, video_url, data["caption"])
-                if 'error' not in analysis and 'raw_analysis' not in analysis:
-                    result['analysis'] = analysis
-                    hook = analysis.get('hook', {}).get('technique', 'analyzed')
-                    print(f"    Done: {hook}")
-                    results.append(result)
-                    time.sleep(2)
-                    continue
-            except Exception:
-                print(f"    Direct URL failed, trying upload...")
-
-            # Fallback: download and upload
-            video_bytes = download_video(video_url)
-            print(f"    Downloaded {len(video_bytes) / 1024 / 1024:.1f} MB")
-
-            file = upload_video_to_gemini(client, video_bytes, f"{platform}_{data['post_id']}")
-            print(f"    Uploaded, processing...")
-
-            file = wait_for_processing(client, file)
-            analysis = analyze_video(client, file, data["caption"])
-            result['analysis'] = analysis
-
-            hook = analysis.get('hook', {}).get('technique', 'analyzed')
-            print(f"    Done: {hook}")
-
-            # Cleanup
-            try:
-                client.files.delete(name=file.name)
-            except:
-                pass
-
-            results.append(result)
-            time.sleep(2)
-
-        except Exception as e:
-            print(f"    Error: {e}")
-            result['error'] = str(e)
-            results.append(result)
+    # Videos are independent and network-bound, so analyze several at once
+    with ThreadPoolExecutor(max_workers=min(total, MAX_WORKERS)) as executor:
+        futures = [
+            executor.submit(_process_one, client, post, i, total, platform)
+            for i, post in enumerate(video_posts, 1)
+        ]
+        # Collect in input order so results stay ranked like the outliers
+        results = [r for r in (f.result() for f in futures) if r is not None]
 
     successful = sum(1 for r in results if 'analysis' in r)
     print(f"Successfully analyzed {successful}/{len(video_posts)} videos")
@@ -355,22 +503,16 @@ def main():
     args = parser.parse_args()
 
     print(f"Loading outliers from: {args.input}")
-    with open(args.input, 'r') as f:
-        data = json.load(f)
-
-    # Handle both list format and dict with 'outliers' key
-    if isinstance(data, dict) and 'outliers' in data:
-        outliers = data['outliers']
+    outliers = load_outliers(args.input, args.platform, args.max_videos)
+    if _load_mode(args.input, args.platform, args.max_videos) == "select":
+        print(f"Selected {len(outliers)} video posts (stopped reading at --max-videos)")
     else:
-        outliers = data
-    print(f"Loaded {len(outliers)} outlier posts")
+        print(f"Loaded {len(outliers)} outlier posts")
 
     results = analyze_videos(outliers, args.platform, args.max_videos)
 
     # Save results
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    save_json(results, args.output)
     print(f"\nVideo analysis saved to: {args.output}")
 
 
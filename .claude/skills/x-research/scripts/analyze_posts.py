@@ -5,20 +5,103 @@ Outputs JSON with outliers and metadata for report generation.
 """
 
 import json
+import os
 import argparse
 import statistics
 from datetime import datetime
 from pathlib import Path
 from collections import Counter
+from operator import itemgetter
+import heapq
 import re
 
+# Conditional imports
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Inputs above this size are stream-parsed with ijson (when installed) so the
+# raw file bytes are never held in memory alongside the parsed items
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Patterns applied to every tweet, compiled once
+_URL_RE = re.compile(r'https?://\S+')
+_LIST_RE = re.compile(r'^\d\.|\n\d\.|\n-|\n\u2022')
+
+# Single-pass tweet tokenizer: URL | #hashtag | @mention | 4+ letter word.
+# Runs on the original text; only the matched tokens are lowercased.
+_TOKENS_RE = re.compile(
+    r'(?P<url>(?i:https?)://\S+)|#(?P<tag>\w+)|@(?P<mention>\w+)|(?P<word>\b[a-zA-Z]{4,}\b)'
+)
+
+# Common stop words to filter out
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who',
+    'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only',
+    'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but',
+    'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by',
+    'for', 'with', 'about', 'against', 'between', 'into', 'through',
+    'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up',
+    'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further',
+    'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how',
+    'your', 'my', 'his', 'her', 'its', 'our', 'their', 'get', 'got',
+    'like', 'dont', 'im', 'ive', 'youre', 'youve', 'weve', 'theyre',
+    'theyve', 'hes', 'shes', 'thats', 'whats', 'heres', 'theres',
+    'https', 'http', 'amp', 'rt', 'via'
+})
+
 
 def load_posts(input_path: str) -> list[dict]:
     """Load tweets from JSON file."""
+    if IJSON_AVAILABLE and os.path.getsize(input_path) > STREAM_THRESHOLD_BYTES:
+        with open(input_path, 'rb') as f:
+            return list(ijson.items(f, 'item', use_float=True))
+    if ORJSON_AVAILABLE:
+        with open(input_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(input_path, 'r') as f:
         return json.load(f)
 
 
+def save_json(data, output_path: str):
+    """Write data as indented JSON, creating parent directories."""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+# Engagement metric fields, in calculate_engagement_score order
+_METRIC_KEYS = ('likeCount', 'retweetCount', 'replyCount', 'quoteCount', 'bookmarkCount')
+
+
+def _get_ints(d: dict, keys: tuple) -> tuple:
+    """Look up several count fields at once, treating missing/None values as 0."""
+    get = d.get
+    return tuple(get(k) or 0 for k in keys)
+
+
 def calculate_engagement_score(tweet: dict) -> float:
     """
     Calculate weighted engagement score for a tweet.
@@ -30,22 +113,46 @@ def calculate_engagement_score(tweet: dict) -> float:
     - Quotes (2x): Engagement with commentary
     - Likes (1x): Passive approval
     """
-    likes = tweet.get('likeCount', 0) or 0
-    retweets = tweet.get('retweetCount', 0) or 0
-    replies = tweet.get('replyCount', 0) or 0
-    quotes = tweet.get('quoteCount', 0) or 0
-    bookmarks = tweet.get('bookmarkCount', 0) or 0
+    likes, retweets, replies, quotes, bookmarks = _get_ints(tweet, _METRIC_KEYS)
 
     return likes + (2 * retweets) + (3 * replies) + (2 * quotes) + (4 * bookmarks)
 
 
-def calculate_engagement_rate(tweet: dict) -> float:
-    """Calculate engagement rate relative to follower count."""
+def calculate_engagement_rate(tweet: dict, engagement: float = None) -> float:
+    """
+    Calculate engagement rate relative to follower count.
+    Pass an already computed engagement score to avoid recalculating it.
+    """
     followers = tweet.get('author', {}).get('followers', 1) or 1
-    engagement = calculate_engagement_score(tweet)
+    if engagement is None:
+        engagement = calculate_engagement_score(tweet)
     return (engagement / followers) * 100
 
 
+def _engagement_arrays(tweets: list[dict]) -> tuple:
+    """
+    Vectorized calculate_engagement_score/calculate_engagement_rate.
+    Returns (scores, rates) as int64/float64 arrays aligned with tweets.
+    """
+    n = len(tweets)
+
+    def column(field):
+        return np.fromiter((t.get(field) or 0 for t in tweets), dtype=np.int64, count=n)
+
+    likes = column('likeCount')
+    retweets = column('retweetCount')
+    replies = column('replyCount')
+    quotes = column('quoteCount')
+    bookmarks = column('bookmarkCount')
+    followers = np.fromiter(
+        (t.get('author', {}).get('followers', 1) or 1 for t in tweets), dtype=np.int64, count=n
+    )
+
+    scores = likes + (2 * retweets) + (3 * replies) + (2 * quotes) + (4 * bookmarks)
+    rates = (scores / followers) * 100
+    return scores, rates
+
+
 def identify_outliers(tweets: list[dict], threshold_multiplier: float = 2.0) -> list[dict]:
     """
     Identify outlier tweets that perform significantly above average.
@@ -57,76 +164,72 @@ def identify_outliers(tweets: list[dict], threshold_multiplier: float = 2.0) ->
         return []
 
     # Calculate engagement rates
-    for tweet in tweets:
-        tweet['_engagement_score'] = calculate_engagement_score(tweet)
-        tweet['_engagement_rate'] = calculate_engagement_rate(tweet)
+    if NUMPY_AVAILABLE:
+        scores, rates = _engagement_arrays(tweets)
+        if len(tweets) < 2:
+            indices = range(len(tweets))
+        else:
+            threshold = rates.mean() + (threshold_multiplier * rates.std(ddof=1))
+            indices = np.flatnonzero(rates > threshold).tolist()
+        scores = scores.tolist()
+        rates = rates.tolist()
+    else:
+        scores = [calculate_engagement_score(t) for t in tweets]
+        rates = [calculate_engagement_rate(t, score) for t, score in zip(tweets, scores)]
+        if len(rates) < 2:
+            indices = range(len(tweets))
+        else:
+            mean_rate = statistics.mean(rates)
+            std_dev = statistics.stdev(rates)
+            threshold = mean_rate + (threshold_multiplier * std_dev)
+            indices = [i for i, rate in enumerate(rates) if rate > threshold]
+
+    # Only the returned tweets are annotated
+    outliers = []
+    for i in indices:
+        tweet = tweets[i]
+        tweet['_engagement_score'] = scores[i]
+        tweet['_engagement_rate'] = rates[i]
+        outliers.append(tweet)
+    if len(tweets) < 2:
+        return outliers
 
-    rates = [t['_engagement_rate'] for t in tweets]
+    outliers.sort(key=lambda x: x['_engagement_score'], reverse=True)
 
-    if len(rates) < 2:
-        return tweets
+    return outliers
 
-    mean_rate = statistics.mean(rates)
-    std_dev = statistics.stdev(rates) if len(rates) > 1 else 0
 
-    threshold = mean_rate + (threshold_multiplier * std_dev)
+def _iter_tokens(tweets: list[dict]):
+    """Yield (kind, token) for each hashtag, mention, and keyword in the tweets."""
+    for tweet in tweets:
+        for m in _TOKENS_RE.finditer(tweet.get('text', '')):
+            kind = m.lastgroup
+            if kind == 'url':
+                continue
+            token = m.group(kind).lower()
+            if kind == 'word' and token in _STOP_WORDS:
+                continue
+            yield kind, token
 
-    outliers = [t for t in tweets if t['_engagement_rate'] > threshold]
-    outliers.sort(key=lambda x: x['_engagement_score'], reverse=True)
 
-    return outliers
+def _top(counts: Counter, kind: str, k: int) -> list[tuple]:
+    """Top k (token, count) pairs of one kind, ties in first-seen order like most_common()."""
+    pairs = ((token, count) for (token_kind, token), count in counts.items() if token_kind == kind)
+    return heapq.nlargest(k, pairs, key=itemgetter(1))
 
 
 def extract_topics(tweets: list[dict]) -> dict:
     """
     Extract trending topics, hashtags, and keywords from tweets.
     """
-    hashtags = Counter()
-    mentions = Counter()
-    keywords = Counter()
-
-    # Common stop words to filter out
-    stop_words = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-        'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who',
-        'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both', 'few',
-        'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only',
-        'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but',
-        'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by',
-        'for', 'with', 'about', 'against', 'between', 'into', 'through',
-        'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up',
-        'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further',
-        'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how',
-        'your', 'my', 'his', 'her', 'its', 'our', 'their', 'get', 'got',
-        'like', 'dont', 'im', 'ive', 'youre', 'youve', 'weve', 'theyre',
-        'theyve', 'hes', 'shes', 'thats', 'whats', 'heres', 'theres',
-        'https', 'http', 'amp', 'rt', 'via'
-    }
-
-    for tweet in tweets:
-        text = tweet.get('text', '')
-
-        # Extract hashtags
-        tags = re.findall(r'#(\w+)', text.lower())
-        hashtags.update(tags)
-
-        # Extract mentions
-        ments = re.findall(r'@(\w+)', text.lower())
-        mentions.update(ments)
-
-        # Extract significant words (4+ chars, not URLs, not stop words)
-        text_clean = re.sub(r'https?://\S+', '', text)
-        text_clean = re.sub(r'[@#]\w+', '', text_clean)
-        text_words = re.findall(r'\b[a-zA-Z]{4,}\b', text_clean.lower())
-        filtered_words = [w for w in text_words if w not in stop_words]
-        keywords.update(filtered_words)
+    # One C-level count over every token; top-k is taken per kind without
+    # copying the (mostly singleton) counts into separate counters
+    counts = Counter(_iter_tokens(tweets))
 
     return {
-        'hashtags': hashtags.most_common(20),
-        'mentions': mentions.most_common(20),
-        'keywords': keywords.most_common(30)
+        'hashtags': _top(counts, 'tag', 20),
+        'mentions': _top(counts, 'mention', 20),
+        'keywords': _top(counts, 'word', 30)
     }
 
 
@@ -200,12 +303,13 @@ def analyze_content_patterns(outliers: list[dict]) -> dict:
         if tweet.get('media') or tweet.get('extendedEntities'):
             patterns['has_media'] += 1
 
-        # Check for links
-        if 'http' in text:
+        # Check for links (also tells us whether there are URLs to strip below)
+        has_link = 'http' in text
+        if has_link:
             patterns['has_link'] += 1
 
-        # Check for thread indicator
-        if '\U0001f9f5' in text or 'thread' in text.lower() or '/1' in text:
+        # Check for thread indicator (lowercased copy only made if the cheap checks miss)
+        if '\U0001f9f5' in text or '/1' in text or 'thread' in text.lower():
             patterns['has_thread'] += 1
 
         # Check if quote tweet
@@ -217,14 +321,14 @@ def analyze_content_patterns(outliers: list[dict]) -> dict:
             patterns['question'] += 1
 
         # Check for list format (numbered or bulleted)
-        if re.search(r'^\d\.|\n\d\.|\n-|\n\u2022', text):
+        if _LIST_RE.search(text):
             patterns['list_format'] += 1
 
-        # Tweet length
-        clean_text = re.sub(r'https?://\S+', '', text)
-        if len(clean_text) < 100:
+        # Tweet length (excluding URLs)
+        length = len(_URL_RE.sub('', text)) if has_link else len(text)
+        if length < 100:
             patterns['short_tweet'] += 1
-        elif len(clean_text) < 200:
+        elif length < 200:
             patterns['medium_tweet'] += 1
         else:
             patterns['long_tweet'] += 1
@@ -273,9 +377,7 @@ def main():
         'outliers': [slim_outlier(t) for t in outliers]
     }
 
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, 'w') as f:
-        json.dump(output, f, indent=2, default=str)
+    save_json(output, args.output)
 
     print(f"Outliers saved to: {args.output}")
     print(f"- {len(outliers)} outliers identified")
@@ -7,6 +7,7 @@ Requires APIFY_TOKEN environment variable (or in .env file).
 import os
 import sys
 import json
+import re
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -24,26 +25,57 @@ except ImportError:
     print("Error: apify-client not installed. Run: pip install apify-client")
     sys.exit(1)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Table rows whose first cell is an @handle
+_HANDLE_RE = re.compile(r'^\s*\|\s*@(\w+)\s*\|', re.MULTILINE)
+
 
 def parse_accounts_file(accounts_path: str) -> list[str]:
-    """Parse x-accounts.md and extract handles."""
-    handles = []
-    with open(accounts_path, 'r') as f:
-        in_table = False
-        for line in f:
-            line = line.strip()
-            if line.startswith('| Handle'):
-                in_table = True
-                continue
-            if line.startswith('|---'):
-                continue
-            if in_table and line.startswith('|'):
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 2:
-                    handle = parts[1]
-                    if handle.startswith('@') and not handle.startswith('@example'):
-                        handles.append(handle.lstrip('@'))
-    return handles
+    """Parse x-accounts.md and extract handles from the accounts table."""
+    text = Path(accounts_path).read_text()
+    return [
+        m.group(1) for m in _HANDLE_RE.finditer(text)
+        if not m.group(1).startswith('example')
+    ]
+
+
+def _dumps_indented(item) -> bytes:
+    """Encode one array element with 2-space indent, nested one level deep."""
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(item, default=str, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(item, indent=2, default=str).encode()
+    return encoded.replace(b'\n', b'\n  ')
+
+
+def stream_json_array(items, output_path: str) -> int:
+    """
+    Write items to output_path as an indented JSON array, one item at a time.
+    The array is streamed into a .part file that replaces output_path only once
+    complete, so a failure mid-iteration leaves any previous file intact.
+    Returns the number of items written.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path + '.part'
+    count = 0
+    try:
+        with open(part_path, 'wb') as f:
+            f.write(b'[')
+            for item in items:
+                f.write(b',\n  ' if count else b'\n  ')
+                f.write(_dumps_indented(item))
+                count += 1
+            f.write(b'\n]' if count else b']')
+        os.replace(part_path, output_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    return count
 
 
 def fetch_tweets(
@@ -51,7 +83,7 @@ def fetch_tweets(
     days_back: int = 30,
     max_items_per_handle: int = 100,
     output_path: str = None
-) -> list[dict]:
+) -> int | list[dict]:
     """
     Fetch tweets from specified handles using Apify Tweet Scraper V2.
 
@@ -62,7 +94,9 @@ def fetch_tweets(
         output_path: Optional path to save raw JSON output
 
     Returns:
-        List of tweet objects
+        With output_path: the number of tweets fetched. The tweets are streamed
+        to output_path without being kept in memory; read that file for the data.
+        Without output_path: the list of tweets, as before.
     """
     token = os.environ.get('APIFY_TOKEN')
     if not token:
@@ -94,20 +128,18 @@ def fetch_tweets(
     # Run the Actor
     run = client.actor("apidojo/tweet-scraper").call(run_input=run_input)
 
-    # Fetch results
-    tweets = []
-    for item in client.dataset(run["defaultDatasetId"]).iterate_items():
-        tweets.append(item)
-
-    print(f"Fetched {len(tweets)} tweets total")
+    # Fetch results, writing each page of items straight to disk when saving
+    items = client.dataset(run["defaultDatasetId"]).iterate_items()
+    if not output_path:
+        tweets = list(items)
+        print(f"Fetched {len(tweets)} tweets total")
+        return tweets
 
-    if output_path:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(tweets, f, indent=2, default=str)
-        print(f"Saved raw data to: {output_path}")
+    count = stream_json_array(items, output_path)
+    print(f"Fetched {count} tweets total")
+    print(f"Saved raw data to: {output_path}")
 
-    return tweets
+    return count
 
 
 def main():
@@ -140,19 +172,20 @@ def main():
 
     print(f"Handles to fetch: {', '.join(handles)}")
 
-    tweets = fetch_tweets(
+    result = fetch_tweets(
         handles=handles,
         days_back=args.days,
         max_items_per_handle=args.max_items,
         output_path=args.output
     )
+    count = result if args.output else len(result)
 
     # Output summary
-    if tweets:
-        print(f"\nFetch complete. {len(tweets)} tweets retrieved.")
+    if count:
+        print(f"\nFetch complete. {count} tweets retrieved.")
         print("Use analyze_tweets.py to identify outliers and generate report.")
 
-    return tweets
+    return count
 
 
 if __name__ == '__main__':
@@ -9,31 +9,82 @@ Downloads thumbnails and generates a markdown report.
 """
 
 import argparse
+import http.client
+import hashlib
+import heapq
+import io
 import json
 import os
+import re
+import shutil
 import sys
-from datetime import datetime, timedelta
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 
+# Conditional imports
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared connection pool so requests to TubeLab and the thumbnail CDN reuse TLS connections
+if URLLIB3_AVAILABLE:
+    _HTTP = urllib3.PoolManager(maxsize=32, retries=urllib3.Retry(3, backoff_factor=0.3))
+
+# Concurrent thumbnail/transcript downloads
+MAX_DOWNLOAD_WORKERS = 16
+
+# Search responses are cached here so repeat runs skip the API
+SEARCH_CACHE_DIR = Path.home() / ".cache" / "tubelab"
+CACHE_TTL = 3600  # seconds
+
+
+_ENV_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["']?(.*?)["']?[ \t]*$""",
+    re.MULTILINE,
+)
+_env_loaded = False
+
 
 def load_env_file():
-    """Load .env file from project root."""
+    """Load .env file from project root (once per process)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
     current = Path(__file__).resolve().parent
     for _ in range(10):
         env_path = current / ".env"
-        if env_path.exists():
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, _, value = line.partition("=")
-                        value = value.strip().strip('"').strip("'")
-                        os.environ.setdefault(key.strip(), value)
-            return
-        current = current.parent
+        try:
+            text = env_path.read_text()
+        except OSError:
+            current = current.parent
+            continue
+        for key, value in _ENV_RE.findall(text):
+            os.environ.setdefault(key, value)
+        return
+
+
+@lru_cache(maxsize=None)
+def api_headers(api_key: str) -> dict:
+    """TubeLab request headers, built once per key. Treat as read-only."""
+    return {"Authorization": f"Api-Key {api_key}", "Accept": "application/json"}
 
 
 def get_api_key():
@@ -47,7 +98,68 @@ def get_api_key():
     return api_key
 
 
-def search_outliers(queries: list[str], api_key: str, days_back: int = 30, min_views: int = 5000) -> list[dict]:
+# Network errors that can be raised while a response body is being read
+_READ_ERRORS = (TimeoutError, ConnectionError, http.client.HTTPException)
+if URLLIB3_AVAILABLE:
+    _READ_ERRORS += (urllib3.exceptions.HTTPError,)
+
+
+@contextmanager
+def open_url(url: str, headers: dict, timeout: float):
+    """
+    GET a URL and yield the readable response.
+    Uses the pooled urllib3 manager when available, otherwise urlopen; either way
+    failures surface as HTTPError/URLError so callers handle them the same,
+    including errors raised while the caller reads the body.
+    """
+    if not URLLIB3_AVAILABLE:
+        try:
+            with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+                yield response
+        except _READ_ERRORS as e:
+            raise URLError(e) from e
+        return
+
+    try:
+        response = _HTTP.request("GET", url, headers=headers, timeout=timeout, preload_content=False)
+    except urllib3.exceptions.HTTPError as e:
+        raise URLError(e) from e
+    try:
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        yield response
+    except _READ_ERRORS as e:
+        # The body is read by the caller, so dropped connections and read
+        # timeouts surface here rather than from request()
+        raise URLError(e) from e
+    finally:
+        response.release_conn()
+
+
+def json_loads(data: bytes):
+    """Parse a JSON response body, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def write_json(path: Path, data, indent: bool = True):
+    """Write data to path as JSON, indented unless indent is False."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+    elif indent:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+
+def search_outliers(
+    queries: list[str],
+    api_key: str,
+    days_back: int = 30,
+    min_views: int = 5000,
+    use_cache: bool = True
+) -> list[dict]:
     """
     Search for outlier videos using TubeLab API.
 
@@ -56,6 +168,7 @@ def search_outliers(queries: list[str], api_key: str, days_back: int = 30, min_v
         api_key: TubeLab API key
         days_back: How many days back to search
         min_views: Minimum view count filter
+        use_cache: Reuse a response cached less than CACHE_TTL seconds ago
 
     Returns:
         List of video objects from API
@@ -82,14 +195,26 @@ def search_outliers(queries: list[str], api_key: str, days_back: int = 30, min_v
 
     url = f"{base_url}?{urlencode(params)}"
 
-    req = Request(url)
-    req.add_header("Authorization", f"Api-Key {api_key}")
-    req.add_header("Accept", "application/json")
+    # The URL carries the queries, date range and view filter
+    cache_key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    cache_path = SEARCH_CACHE_DIR / f"{cache_key}.json"
+    if use_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < CACHE_TTL:
+                return json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass
 
     try:
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return data.get("hits", [])
+        with open_url(url, api_headers(api_key), timeout=30) as response:
+            data = json_loads(response.read())
+        hits = data.get("hits", [])
+        try:
+            SEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            write_json(cache_path, hits, indent=False)
+        except OSError:
+            pass
+        return hits
 
     except HTTPError as e:
         print(f"API error: {e.code} - {e.reason}", file=sys.stderr)
@@ -105,7 +230,56 @@ def search_outliers(queries: list[str], api_key: str, days_back: int = 30, min_v
         return []
 
 
-def score_video(video: dict) -> float:
+@dataclass(slots=True)
+class VideoRec:
+    """The fields of a TubeLab search hit used for ranking and reporting."""
+    id: str
+    title: str
+    description: str
+    channel_title: str
+    channel_subs: int
+    views: int
+    likes: int
+    comments: int
+    z_score: float | None
+    published_at: str
+    avg_views: int
+    thumbnail_url: str | None
+    raw: dict = field(repr=False)
+
+    @classmethod
+    def from_hit(cls, hit: dict) -> "VideoRec":
+        snippet = hit.get("snippet", {})
+        stats = hit.get("statistics", {})
+        channel = snippet.get("channel", {})
+        thumbnails = snippet.get("thumbnails", {})
+
+        # Prefer high quality, fall back to medium, then default
+        thumb_url = next(
+            (url for quality in ("high", "medium", "default")
+             if (url := thumbnails.get(quality, {}).get("url"))),
+            None,
+        )
+
+        views = stats.get("viewCount", 0)
+        return cls(
+            id=hit.get("id", ""),
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            channel_title=channel.get("title", ""),
+            channel_subs=channel.get("subscribersCount", 0),
+            views=views,
+            likes=stats.get("likeCount", 0),
+            comments=stats.get("commentCount", 0),
+            z_score=stats.get("zScore", 0),
+            published_at=snippet.get("publishedAt", ""),
+            avg_views=channel.get("averageViews", views),
+            thumbnail_url=thumb_url,
+            raw=hit,
+        )
+
+
+def score_video(video: VideoRec, now_utc: datetime = None) -> float:
     """
     Calculate a composite score for ranking videos.
     Balances outlier performance with recency.
@@ -113,19 +287,26 @@ def score_video(video: dict) -> float:
     Score formula: zScore * recency_boost
     - zScore: How much video outperforms channel average
     - recency_boost: 1.0 for today, decays by 5% per day
+
+    Pass now_utc when scoring a batch so the clock is read once.
     """
-    stats = video.get("statistics", {})
-    z_score = stats.get("zScore", 0) or 0
+    z_score = video.z_score or 0
 
     # Parse publish date
-    snippet = video.get("snippet", {})
-    published_at = snippet.get("publishedAt", "")
+    published_at = video.published_at
 
     recency_boost = 1.0
     if published_at:
         try:
-            pub_date = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-            days_old = (datetime.now(pub_date.tzinfo) - pub_date).days
+            if published_at.endswith("Z"):
+                pub_date = datetime.fromisoformat(published_at[:-1] + "+00:00")
+            else:
+                pub_date = datetime.fromisoformat(published_at)
+            if pub_date.tzinfo is None:
+                pub_date = pub_date.replace(tzinfo=timezone.utc)
+            if now_utc is None:
+                now_utc = datetime.now(timezone.utc)
+            days_old = (now_utc - pub_date).days
             # 5% decay per day, minimum 0.3x
             recency_boost = max(0.3, 1.0 - (days_old * 0.05))
         except (ValueError, TypeError):
@@ -134,38 +315,38 @@ def score_video(video: dict) -> float:
     return z_score * recency_boost
 
 
-def download_thumbnail(video: dict, output_dir: Path):
-    """Download video thumbnail to output directory."""
-    video_id = video.get("id")
-    snippet = video.get("snippet", {})
-    thumbnails = snippet.get("thumbnails", {})
-
-    # Prefer high quality, fall back to medium, then default
-    thumb_url = None
-    for quality in ["high", "medium", "default"]:
-        if quality in thumbnails and thumbnails[quality].get("url"):
-            thumb_url = thumbnails[quality]["url"]
-            break
+def download_thumbnail(video: VideoRec, output_dir: Path, use_cache: bool = True):
+    """Download video thumbnail to output directory, reusing an existing file unless use_cache is False."""
+    video_id = video.id
+    thumb_url = video.thumbnail_url
 
     if not thumb_url or not video_id:
         return None
 
     output_path = output_dir / f"{video_id}.jpg"
+    if use_cache and output_path.exists() and output_path.stat().st_size > 0:
+        return str(output_path)
 
-    try:
-        req = Request(thumb_url)
-        req.add_header("User-Agent", "Mozilla/5.0")
+    # Stream into a partial file, renamed once complete
+    part_path = output_path.with_name(output_path.name + ".part")
 
-        with urlopen(req, timeout=15) as response:
-            output_path.write_bytes(response.read())
+    try:
+        with open_url(thumb_url, {"User-Agent": "Mozilla/5.0"}, timeout=15) as response:
+            with open(part_path, "wb") as f:
+                shutil.copyfileobj(response, f, length=64 * 1024)
+        part_path.replace(output_path)
 
         return str(output_path)
-    except (HTTPError, URLError) as e:
+    except OSError as e:
+        # HTTPError/URLError from open_url, or a failed write to output_dir
         print(f"Failed to download thumbnail for {video_id}: {e}", file=sys.stderr)
         return None
+    finally:
+        # Gone already once renamed; otherwise drop the partial download
+        part_path.unlink(missing_ok=True)
 
 
-def fetch_transcript(video_id: str, api_key: str, output_dir: Path) -> str | None:
+def fetch_transcript(video_id: str, api_key: str, output_dir: Path, use_cache: bool = True) -> str | None:
     """
     Fetch video transcript using TubeLab API.
 
@@ -173,19 +354,20 @@ def fetch_transcript(video_id: str, api_key: str, output_dir: Path) -> str | Non
         video_id: YouTube video ID
         api_key: TubeLab API key
         output_dir: Directory to save transcript file
+        use_cache: Reuse a transcript already saved in output_dir
 
     Returns:
         Path to saved transcript file, or None if failed
     """
-    url = f"https://public-api.tubelab.net/v1/video/transcript/{video_id}"
+    output_path = output_dir / f"{video_id}.txt"
+    if use_cache and output_path.exists():
+        return str(output_path)
 
-    req = Request(url)
-    req.add_header("Authorization", f"Api-Key {api_key}")
-    req.add_header("Accept", "application/json")
+    url = f"https://public-api.tubelab.net/v1/video/transcript/{video_id}"
 
     try:
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        with open_url(url, api_headers(api_key), timeout=30) as response:
+            data = json_loads(response.read())
 
         # Extract transcript text from response
         # API returns segments with text, start time, duration
@@ -207,7 +389,6 @@ def fetch_transcript(video_id: str, api_key: str, output_dir: Path) -> str | Non
         if not transcript_lines:
             return None
 
-        output_path = output_dir / f"{video_id}.txt"
         output_path.write_text("\n".join(transcript_lines), encoding="utf-8")
         return str(output_path)
 
@@ -236,92 +417,94 @@ def format_number(n: int) -> str:
 
 
 def generate_report(
-    direct_videos: list[dict],
-    adjacent_videos: list[dict],
+    direct_videos: list[VideoRec],
+    adjacent_videos: list[VideoRec],
     output_dir: Path,
     thumbnail_dir: Path,
     keywords: list[str],
-    adjacent_keywords: list[str]
+    adjacent_keywords: list[str],
+    downloaded: set[str] = None
 ) -> str:
-    """Generate markdown report of top videos."""
-    report_lines = [
-        f"# YouTube Outlier Research Report",
-        f"",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        f"",
-        f"---",
-        f"",
-        f"## Direct Niche Outliers",
-        f"",
-        f"**Keywords:** {', '.join(keywords)}",
-        f"**Filter:** 5K+ views, last 30 days",
-        f"",
-    ]
+    """
+    Generate markdown report of top videos.
 
-    def add_video_section(videos: list[dict], start_num: int = 1) -> int:
+    downloaded is the set of video ids whose thumbnails were saved; when
+    omitted, thumbnail_dir is checked for each video instead.
+    """
+    buf = io.StringIO()
+    buf.write(
+        f"# YouTube Outlier Research Report\n"
+        f"\n"
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+        f"## Direct Niche Outliers\n"
+        f"\n"
+        f"**Keywords:** {', '.join(keywords)}\n"
+        f"**Filter:** 5K+ views, last 30 days\n"
+        f"\n"
+    )
+
+    def add_video_section(videos: list[VideoRec], start_num: int = 1) -> int:
         num = start_num
         for video in videos:
-            video_id = video.get("id", "")
-            snippet = video.get("snippet", {})
-            stats = video.get("statistics", {})
-            channel = snippet.get("channel", {})
-
-            title = snippet.get("title", "Untitled")
-            channel_title = channel.get("title", "Unknown")
-            channel_subs = channel.get("subscribersCount", 0)
-            views = stats.get("viewCount", 0)
-            likes = stats.get("likeCount", 0)
-            z_score = stats.get("zScore", 0) or 0
-            published = snippet.get("publishedAt", "")[:10]
+            video_id = video.id
+            title = video.title or "Untitled"
+            channel_title = video.channel_title or "Unknown"
+            channel_subs = video.channel_subs
+            views = video.views
+            likes = video.likes
+            z_score = video.z_score or 0
+            published = video.published_at[:10]
 
             # Calculate performance ratio
-            avg_views = channel.get("averageViews", views)
+            avg_views = video.avg_views
             ratio = views / avg_views if avg_views > 0 else 1.0
 
-            thumb_path = thumbnail_dir / f"{video_id}.jpg"
-            thumb_ref = f"thumbnails/{video_id}.jpg" if thumb_path.exists() else ""
-
-            report_lines.extend([
-                f"### {num}. {title}",
-                f"",
-                f"**Channel:** {channel_title} ({format_number(channel_subs)} subs)",
-                f"**Published:** {published}",
-                f"**Views:** {format_number(views)} | **Likes:** {format_number(likes)}",
-                f"**Outlier Score (zScore):** {z_score:.1f} | **vs Avg:** {ratio:.1f}x",
-                f"**URL:** https://youtube.com/watch?v={video_id}",
-                f"",
-            ])
-
-            if thumb_ref:
-                report_lines.append(f"![Thumbnail]({thumb_ref})")
-                report_lines.append("")
-
-            report_lines.append("---")
-            report_lines.append("")
+            if downloaded is not None:
+                has_thumb = video_id in downloaded
+            else:
+                has_thumb = (thumbnail_dir / f"{video_id}.jpg").exists()
+            thumb_md = f"![Thumbnail](thumbnails/{video_id}.jpg)\n\n" if has_thumb else ""
+
+            buf.write(
+                f"### {num}. {title}\n"
+                f"\n"
+                f"**Channel:** {channel_title} ({format_number(channel_subs)} subs)\n"
+                f"**Published:** {published}\n"
+                f"**Views:** {format_number(views)} | **Likes:** {format_number(likes)}\n"
+                f"**Outlier Score (zScore):** {z_score:.1f} | **vs Avg:** {ratio:.1f}x\n"
+                f"**URL:** https://youtube.com/watch?v={video_id}\n"
+                f"\n"
+                f"{thumb_md}"
+                f"---\n"
+                f"\n"
+            )
             num += 1
         return num
 
     if direct_videos:
         add_video_section(direct_videos)
     else:
-        report_lines.append("*No videos found matching criteria.*")
-        report_lines.append("")
-
-    report_lines.extend([
-        f"## Adjacent Audience Outliers",
-        f"",
-        f"**Keywords:** {', '.join(adjacent_keywords)}",
-        f"**Filter:** 10K+ views, last 30 days",
-        f"",
-    ])
+        buf.write("*No videos found matching criteria.*\n\n")
+
+    buf.write(
+        f"## Adjacent Audience Outliers\n"
+        f"\n"
+        f"**Keywords:** {', '.join(adjacent_keywords)}\n"
+        f"**Filter:** 10K+ views, last 30 days\n"
+        f"\n"
+    )
 
     if adjacent_videos:
         add_video_section(adjacent_videos)
     else:
-        report_lines.append("*No videos found matching criteria.*")
-        report_lines.append("")
+        buf.write("*No videos found matching criteria.*\n\n")
 
-    return "\n".join(report_lines)
+    # Every block ends with a blank line; the old line-join form had no
+    # trailing newline after it, so drop the final one.
+    return buf.getvalue()[:-1]
 
 
 def main():
@@ -363,6 +546,11 @@ def main():
         action="store_true",
         help="Also output raw JSON data"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached search results and re-download saved thumbnails and transcripts"
+    )
 
     args = parser.parse_args()
 
@@ -384,61 +572,113 @@ def main():
     print(f"Search 1: Direct niche")
     print(f"  Keywords: {', '.join(args.keywords)}")
     print(f"  Min views: 5K")
-
-    direct_videos = search_outliers(
-        queries=args.keywords,
-        api_key=api_key,
-        days_back=args.days,
-        min_views=5000
-    )
-    print(f"  Found: {len(direct_videos)} videos")
     print()
 
     # Search 2: Adjacent keywords (10K min views)
     print(f"Search 2: Adjacent audience")
     print(f"  Keywords: {', '.join(args.adjacent_keywords)}")
     print(f"  Min views: 10K")
+    print()
 
-    adjacent_videos = search_outliers(
-        queries=args.adjacent_keywords,
-        api_key=api_key,
-        days_back=args.days,
-        min_views=10000
-    )
-    print(f"  Found: {len(adjacent_videos)} videos")
+    # The two searches are independent, so run them at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        direct_future = executor.submit(
+            search_outliers,
+            queries=args.keywords,
+            api_key=api_key,
+            days_back=args.days,
+            min_views=5000,
+            use_cache=not args.no_cache
+        )
+        adjacent_future = executor.submit(
+            search_outliers,
+            queries=args.adjacent_keywords,
+            api_key=api_key,
+            days_back=args.days,
+            min_views=10000,
+            use_cache=not args.no_cache
+        )
+        direct_videos = [VideoRec.from_hit(hit) for hit in direct_future.result()]
+        adjacent_videos = [VideoRec.from_hit(hit) for hit in adjacent_future.result()]
+
+    print(f"Found: {len(direct_videos)} direct + {len(adjacent_videos)} adjacent videos")
     print()
 
     # Score and rank videos
-    def rank_videos(videos: list[dict], top_n: int) -> list[dict]:
-        scored = [(score_video(v), v) for v in videos]
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [v for _, v in scored[:top_n]]
+    now_utc = datetime.now(timezone.utc)
+
+    def rank_videos(videos: list[VideoRec], top_n: int) -> list[VideoRec]:
+        # A zScore <= 0 can only score <= 0, so those videos are scored
+        # just when there aren't enough positive ones to fill top_n
+        positive, rest = [], []
+        for v in videos:
+            (positive if (v.z_score or 0) > 0 else rest).append(v)
+
+        def key(v):
+            return score_video(v, now_utc)
+
+        top = heapq.nlargest(top_n, positive, key=key)
+        if len(top) < top_n:
+            top += heapq.nlargest(top_n - len(top), rest, key=key)
+        return top
 
     top_direct = rank_videos(direct_videos, args.top)
     top_adjacent = rank_videos(adjacent_videos, args.top)
 
     # Remove duplicates from adjacent that appear in direct
-    direct_ids = {v.get("id") for v in top_direct}
-    top_adjacent = [v for v in top_adjacent if v.get("id") not in direct_ids][:args.top]
+    direct_ids = {v.id for v in top_direct}
+    top_adjacent = [v for v in top_adjacent if v.id not in direct_ids][:args.top]
 
     print(f"Selected top {len(top_direct)} direct + {len(top_adjacent)} adjacent videos")
     print()
 
-    # Download thumbnails
-    print("Downloading thumbnails...")
-    for video in top_direct + top_adjacent:
-        download_thumbnail(video, thumbnails_dir)
-
-    # Fetch transcripts
-    print("Fetching transcripts...")
-    transcript_count = 0
-    for video in top_direct + top_adjacent:
-        video_id = video.get("id")
-        if video_id and fetch_transcript(video_id, api_key, transcripts_dir):
-            transcript_count += 1
-    print(f"  Fetched {transcript_count} transcripts")
+    # One pass over the selected videos: normalize each to the format
+    # expected by video-content-analyzer and schedule its thumbnail and
+    # transcript. Each download is one blocking HTTP round trip, so they
+    # run concurrently, and a video selected twice is only fetched once.
+    print("Downloading thumbnails and fetching transcripts...")
+    all_outliers = []
+    thumbnail_futures = {}
+    transcript_futures = {}
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        for video in chain(top_direct, top_adjacent):
+            video_id = video.id
+            all_outliers.append({
+                "id": video_id,
+                "videoId": video_id,
+                "url": f"https://youtube.com/watch?v={video_id}",
+                "title": video.title,
+                "description": video.description,
+                "channelTitle": video.channel_title,
+                "viewCount": video.views,
+                "likeCount": video.likes,
+                "commentCount": video.comments,
+                "zScore": video.z_score,
+                "publishedAt": video.published_at,
+                "channelSubs": video.channel_subs,
+                "transcript_path": None,  # filled in once transcripts are fetched
+            })
+
+            if video_id in thumbnail_futures:
+                continue
+            thumbnail_futures[video_id] = executor.submit(
+                download_thumbnail, video, thumbnails_dir, not args.no_cache
+            )
+            if video_id:
+                transcript_futures[video_id] = executor.submit(
+                    fetch_transcript, video_id, api_key, transcripts_dir, not args.no_cache
+                )
+
+        transcripts_by_id: dict[str, str] = {
+            vid: path for vid, f in transcript_futures.items() if (path := f.result())
+        }
+        downloaded = {vid for vid, f in thumbnail_futures.items() if f.result()}
+    print(f"  Fetched {len(transcripts_by_id)} transcripts")
     print()
 
+    for outlier in all_outliers:
+        outlier["transcript_path"] = transcripts_by_id.get(outlier["id"])
+
     # Generate report
     report_path = output_dir / "report.md"
 
@@ -448,73 +688,46 @@ def main():
         output_dir,
         thumbnails_dir,
         args.keywords,
-        args.adjacent_keywords
+        args.adjacent_keywords,
+        downloaded
     )
-    report_path.write_text(report)
+    report_path.write_text(report, encoding="utf-8")
 
     print(f"Report saved: {report_path}")
 
     # Save outliers JSON (required for video analysis)
     outliers_path = output_dir / "outliers.json"
-    all_outliers = []
-    for video in top_direct + top_adjacent:
-        video_id = video.get("id", "")
-        snippet = video.get("snippet", {})
-        stats = video.get("statistics", {})
-        channel = snippet.get("channel", {})
-
-        # Normalize to format expected by video-content-analyzer
-        outlier = {
-            "id": video_id,
-            "videoId": video_id,
-            "url": f"https://youtube.com/watch?v={video_id}",
-            "title": snippet.get("title", ""),
-            "description": snippet.get("description", ""),
-            "channelTitle": channel.get("title", ""),
-            "viewCount": stats.get("viewCount", 0),
-            "likeCount": stats.get("likeCount", 0),
-            "commentCount": stats.get("commentCount", 0),
-            "zScore": stats.get("zScore", 0),
-            "publishedAt": snippet.get("publishedAt", ""),
-            "channelSubs": channel.get("subscribersCount", 0),
-            "transcript_path": str(transcripts_dir / f"{video_id}.txt") if (transcripts_dir / f"{video_id}.txt").exists() else None,
-        }
-        all_outliers.append(outlier)
-
     outliers_data = {
         "outliers": all_outliers,
         "keywords": args.keywords,
         "adjacent_keywords": args.adjacent_keywords,
         "total_videos": len(all_outliers),
     }
-    outliers_path.write_text(json.dumps(outliers_data, indent=2))
+    write_json(outliers_path, outliers_data)
     print(f"Outliers JSON saved: {outliers_path}")
 
     # Optionally save raw JSON
     if args.json:
         json_path = output_dir / "raw-data.json"
         json_data = {
-            "direct": top_direct,
-            "adjacent": top_adjacent,
+            "direct": [v.raw for v in top_direct],
+            "adjacent": [v.raw for v in top_adjacent],
             "keywords": args.keywords,
             "adjacent_keywords": args.adjacent_keywords,
         }
-        json_path.write_text(json.dumps(json_data, indent=2))
+        # Raw API passthrough, not meant for reading - keep it compact
+        write_json(json_path, json_data, indent=False)
         print(f"Raw JSON saved: {json_path}")
 
     print()
     print("=== Top Direct Niche Videos ===")
     for i, video in enumerate(top_direct, 1):
-        title = video.get("snippet", {}).get("title", "")[:55]
-        views = video.get("statistics", {}).get("viewCount", 0)
-        print(f"  {i}. {title}... ({format_number(views)} views)")
+        print(f"  {i}. {video.title[:55]}... ({format_number(video.views)} views)")
 
     print()
     print("=== Top Adjacent Audience Videos ===")
     for i, video in enumerate(top_adjacent, 1):
-        title = video.get("snippet", {}).get("title", "")[:55]
-        views = video.get("statistics", {}).get("viewCount", 0)
-        print(f"  {i}. {title}... ({format_number(views)} views)")
+        print(f"  {i}. {video.title[:55]}... ({format_number(video.views)} views)")
 
 
 if __name__ == "__main__":
@@ -5,30 +5,68 @@ Outputs JSON for Claude to analyze and extract niche keywords.
 """
 
 import argparse
+import http.client
 import json
 import os
+import re
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+# Conditional imports
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared connection pool so repeated requests to TubeLab reuse TLS connections
+if URLLIB3_AVAILABLE:
+    _HTTP = urllib3.PoolManager(maxsize=32, retries=urllib3.Retry(3, backoff_factor=0.3))
+
+
+_ENV_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["']?(.*?)["']?[ \t]*$""",
+    re.MULTILINE,
+)
+_env_loaded = False
+
+# UC + 22 URL-safe base64 characters
+_CHANNEL_ID_RE = re.compile(r"UC[A-Za-z0-9_-]{22}")
+
 
 def load_env_file():
-    """Load .env file from project root."""
-    # Walk up from script location to find .env
+    """Load .env file from project root (once per process)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
     current = Path(__file__).resolve().parent
-    for _ in range(10):  # Max 10 levels up
+    for _ in range(10):
         env_path = current / ".env"
-        if env_path.exists():
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, _, value = line.partition("=")
-                        value = value.strip().strip('"').strip("'")  # Remove quotes
-                        os.environ.setdefault(key.strip(), value)
-            return
-        current = current.parent
+        try:
+            text = env_path.read_text()
+        except OSError:
+            current = current.parent
+            continue
+        for key, value in _ENV_RE.findall(text):
+            os.environ.setdefault(key, value)
+        return
+
+
+@lru_cache(maxsize=None)
+def api_headers(api_key: str) -> dict:
+    """TubeLab request headers, built once per key. Treat as read-only."""
+    return {"Authorization": f"Api-Key {api_key}", "Accept": "application/json"}
 
 
 def get_api_key():
@@ -42,6 +80,51 @@ def get_api_key():
     return api_key
 
 
+# Network errors that can be raised while a response body is being read
+_READ_ERRORS = (TimeoutError, ConnectionError, http.client.HTTPException)
+if URLLIB3_AVAILABLE:
+    _READ_ERRORS += (urllib3.exceptions.HTTPError,)
+
+
+@contextmanager
+def open_url(url: str, headers: dict, timeout: float):
+    """
+    GET a URL and yield the readable response.
+    Uses the pooled urllib3 manager when available, otherwise urlopen; either way
+    failures surface as HTTPError/URLError so callers handle them the same,
+    including errors raised while the caller reads the body.
+    """
+    if not URLLIB3_AVAILABLE:
+        try:
+            with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+                yield response
+        except _READ_ERRORS as e:
+            raise URLError(e) from e
+        return
+
+    try:
+        response = _HTTP.request("GET", url, headers=headers, timeout=timeout, preload_content=False)
+    except urllib3.exceptions.HTTPError as e:
+        raise URLError(e) from e
+    try:
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        yield response
+    except _READ_ERRORS as e:
+        # The body is read by the caller, so dropped connections and read
+        # timeouts surface here rather than from request()
+        raise URLError(e) from e
+    finally:
+        response.release_conn()
+
+
+def json_loads(data: bytes):
+    """Parse a JSON response body, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
 def get_channel_videos(channel_id: str, api_key: str) -> dict:
     """
     Fetch videos from a YouTube channel using TubeLab API.
@@ -55,13 +138,9 @@ def get_channel_videos(channel_id: str, api_key: str) -> dict:
     """
     url = f"https://public-api.tubelab.net/v1/channel/videos/{channel_id}"
 
-    req = Request(url)
-    req.add_header("Authorization", f"Api-Key {api_key}")
-    req.add_header("Accept", "application/json")
-
     try:
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        with open_url(url, api_headers(api_key), timeout=30) as response:
+            data = json_loads(response.read())
             return data.get("item", {})
 
     except HTTPError as e:
@@ -95,9 +174,11 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate channel ID format
-    if len(args.channel_id) != 24:
-        print(f"Warning: Channel ID should be 24 characters, got {len(args.channel_id)}", file=sys.stderr)
+    # Validate channel ID format locally - the API would only reject it with a 400
+    if not _CHANNEL_ID_RE.fullmatch(args.channel_id):
+        print(f"Invalid channel ID format: {args.channel_id}", file=sys.stderr)
+        print("Channel IDs are 24 characters: UC followed by 22 letters, digits, - or _", file=sys.stderr)
+        sys.exit(1)
 
     api_key = get_api_key()
 